@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Shared dependency probe for the test scripts.
+
+Sets up sys.path and imports the agent symbols exactly once per process;
+both test scripts import from here, so repeated runs under one interpreter
+pay the google-adk/PyMuPDF import cost a single time.
+"""
+
+import sys
+import os
+
+# Add the app directory to the Python path
+_APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app')
+if _APP_DIR not in sys.path:
+    sys.path.append(_APP_DIR)
+
+try:
+    from multi_tool_agent.agent import (
+        root_agent,
+        search_news_articles,
+        search_x_com_posts,
+        get_comprehensive_analysis,
+        analyze_local_pdfs
+    )
+    DEPENDENCIES_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠️  Missing dependency: {e}")
+    print("Please install dependencies with: pip install -r requirements.txt")
+    DEPENDENCIES_AVAILABLE = False
+    root_agent = None
+    search_news_articles = None
+    search_x_com_posts = None
+    get_comprehensive_analysis = None
+    analyze_local_pdfs = None
+
+# The document analysis agent is optional; scripts that need it check for None
+try:
+    from multi_tool_agent.agent import document_analysis_agent
+except ImportError:
+    document_analysis_agent = None
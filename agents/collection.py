@@ -0,0 +1,51 @@
+"""
+Collection helper for running the source scrapers concurrently.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from agents.news_scraper import search_news
+from agents.research_scraper import search_research
+from agents.x_scraper import search_x_com
+
+
+def gather_sources(domain: str) -> dict:
+    """
+    Search news, X.com, and research sources for a domain concurrently.
+
+    The three searches are independent, so running them in a thread pool
+    brings total latency down to the slowest source instead of the sum of
+    all three.
+
+    Args:
+        domain (str): The domain keyword to search for
+
+    Returns:
+        dict: Status and collected 'news', 'social', and 'research' lists or error message
+    """
+    if not domain or domain.strip() == "":
+        return {
+            "status": "error",
+            "error_message": "Domain keyword required."
+        }
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        news_future = executor.submit(search_news, domain)
+        x_com_future = executor.submit(search_x_com, domain)
+        research_future = executor.submit(search_research, domain)
+
+    news_result = news_future.result()
+    x_com_result = x_com_future.result()
+    research_result = research_future.result()
+
+    return {
+        "status": "success",
+        "news": news_result.get("articles", []),
+        "social": x_com_result.get("posts", []),
+        "research": research_result.get("papers", [])
+    }
+
+
+if __name__ == "__main__":
+    result = gather_sources("Fintech")
+    print(result)
@@ -2,18 +2,44 @@
 NewsAPI Mock Scraper Agent for simulating news data collection.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from google.adk.agents import LlmAgent
 from google.adk.models.lite_llm import LiteLlm
 from typing import Dict
 
 
+# Mock headline templates, defined once at import
+_NEWS_TEMPLATES = (
+    "Sample headline about {domain} #1",
+    "Sample headline about {domain} #2",
+    "Breaking: Major {domain} company announces breakthrough innovation",
+    "Industry experts predict significant growth in {domain} sector",
+    "New regulations could impact {domain} market dynamics",
+    "Global {domain} market reaches record high this quarter",
+    "Startup disrupts traditional {domain} industry with AI technology",
+    "Investment surge in {domain} companies signals market confidence",
+    "Research reveals consumer trends shifting toward {domain} solutions",
+    "International summit addresses future of {domain} innovation"
+)
+
+
+@lru_cache(maxsize=128)
+def _search_news_cached(domain: str) -> tuple:
+    """Build immutable mock article views for a domain, cached per domain."""
+    return tuple(
+        MappingProxyType({"source": "NewsAPI", "content": template.format(domain=domain)})
+        for template in _NEWS_TEMPLATES
+    )
+
+
 def search_news(domain: str) -> dict:
     """
     Mock function to simulate searching NewsAPI.org for articles about a specific domain.
-    
+
     Args:
         domain (str): The domain keyword to search for
-        
+
     Returns:
         dict: Status and mocked articles data or error message
     """
@@ -22,21 +48,14 @@ def search_news(domain: str) -> dict:
             "status": "error",
             "error_message": "Domain keyword required."
         }
-    
-    # Generate mock news articles based on the domain
-    mock_articles = [
-        {"source": "NewsAPI", "content": f"Sample headline about {domain} #1"},
-        {"source": "NewsAPI", "content": f"Sample headline about {domain} #2"},
-        {"source": "NewsAPI", "content": f"Breaking: Major {domain} company announces breakthrough innovation"},
-        {"source": "NewsAPI", "content": f"Industry experts predict significant growth in {domain} sector"},
-        {"source": "NewsAPI", "content": f"New regulations could impact {domain} market dynamics"},
-        {"source": "NewsAPI", "content": f"Global {domain} market reaches record high this quarter"},
-        {"source": "NewsAPI", "content": f"Startup disrupts traditional {domain} industry with AI technology"},
-        {"source": "NewsAPI", "content": f"Investment surge in {domain} companies signals market confidence"},
-        {"source": "NewsAPI", "content": f"Research reveals consumer trends shifting toward {domain} solutions"},
-        {"source": "NewsAPI", "content": f"International summit addresses future of {domain} innovation"}
-    ]
-    
+
+    # Normalize the domain so whitespace variants share one cache entry
+    domain = domain.strip()
+
+    # Generate mock news articles based on the domain; repeated queries for
+    # the same domain copy the cached immutable views
+    mock_articles = [dict(article) for article in _search_news_cached(domain)]
+
     return {
         "status": "success",
         "articles": mock_articles
@@ -0,0 +1,228 @@
+"""
+PDF Analysis Agent functions for extracting text from local PDF documents.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# Verbose pdfminer logging can dominate extraction time if a pdfminer-based
+# fallback ever enters the import graph; cap it defensively
+logging.getLogger("pdfminer").setLevel(logging.ERROR)
+logging.getLogger("pdfplumber").setLevel(logging.ERROR)
+
+
+# Default docs location used by the coordinator agent in app/multi_tool_agent
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DEFAULT_DOCS_FOLDER = os.path.join(_PROJECT_ROOT, "app", "multi_tool_agent", "docs")
+
+# ASCII lowercase translation table, applied to whole documents in C
+_LOWER_TAB = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz")
+
+# Disk cache for processed PDFs so unchanged files are not re-extracted
+# across runs; entries are keyed on (path, mtime, size)
+_PDF_CACHE_DIR = os.path.join(tempfile.gettempdir(), "mta_pdfcache")
+
+# In-process memo of processed PDFs on the same fingerprint, so repeat calls
+# within one run return without touching the disk cache at all
+_PDF_CACHE: dict = {}
+
+
+def _pdf_cache_file(file_path: str, stat_result: os.stat_result, max_pages: int) -> str:
+    """Return the cache file path for a PDF and its current stat fingerprint."""
+    fingerprint = f"{os.path.abspath(file_path)}|{stat_result.st_mtime_ns}|{stat_result.st_size}|{max_pages}"
+    key = hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(_PDF_CACHE_DIR, key + ".json")
+
+
+def _process_pdf(file_path: str, max_pages: int = 10) -> dict:
+    """Extract and preprocess text from a single PDF file.
+
+    Module-level so it is picklable for the process pool used by
+    analyze_local_pdfs.
+
+    Args:
+        file_path (str): Path to the PDF file to process
+        max_pages (int): Maximum number of pages to extract
+
+    Returns:
+        dict: File info with extracted text or error details.
+    """
+    # Serve an unchanged file from the in-process memo, then the disk cache;
+    # both keys include the page budget so different slices do not collide
+    cache_file = None
+    memo_key = None
+    try:
+        stat_result = os.stat(file_path)
+        memo_key = (os.path.abspath(file_path), stat_result.st_mtime_ns, stat_result.st_size, max_pages)
+        if memo_key in _PDF_CACHE:
+            return dict(_PDF_CACHE[memo_key])
+        cache_file = _pdf_cache_file(file_path, stat_result, max_pages)
+        if os.path.exists(cache_file):
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                file_info = json.load(f)
+            _PDF_CACHE[memo_key] = file_info
+            return dict(file_info)
+    except (OSError, ValueError):
+        pass
+
+    try:
+        # Deferred so importing this module (e.g. for the mock search tools)
+        # doesn't pay PyMuPDF's load time; later calls hit sys.modules
+        import fitz  # PyMuPDF
+
+        print(f"Processing: {file_path}")
+
+        # Extract text using PyMuPDF with size limits; the context managers
+        # close the document and release the mapping even if anything raises
+        chunks = []
+        max_chars_per_page = 5000  # Limit characters per page
+        max_total_chars = 15000  # Conservative limit to prevent token limit issues
+        running_len = 0
+
+        # Memory-map the file and snapshot it to bytes, so the read is served
+        # from the kernel page cache instead of MuPDF's own file I/O; fitz
+        # only accepts bytes-like streams, not the mmap object itself. The
+        # document parses from the snapshot, so the mapping and descriptor
+        # are released before extraction starts
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pdf_bytes = bytes(mm)
+
+        with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+            total_pages = doc.page_count
+
+            for page_num in range(min(total_pages, max_pages)):
+                # Extract through an explicit TextPage; get_text() would
+                # allocate and tear one down internally per call
+                textpage = doc[page_num].get_textpage()
+                page_text = textpage.extractText()
+
+                # Limit characters per page
+                if len(page_text) > max_chars_per_page:
+                    page_text = page_text[:max_chars_per_page] + "... [truncated]"
+
+                chunks.append(page_text)
+
+                # Stop extracting once the total budget is reached; later pages
+                # would only be discarded by the truncation below
+                running_len += len(page_text) + 1
+                if running_len >= max_total_chars:
+                    break
+
+        text_content = "\n".join(chunks)
+
+        # Preprocess text
+        # Remove excessive whitespace and newlines; split()/join collapses
+        # whitespace in one C-level pass without a regex state machine
+        cleaned_text = " ".join(text_content.split())
+
+        # Limit total text size
+        if len(cleaned_text) > max_total_chars:
+            cleaned_text = cleaned_text[:max_total_chars] + "... [content truncated due to size]"
+
+        # Convert to lowercase; bytes.translate is a single C-level table
+        # pass for the common ASCII-dominant document
+        if cleaned_text.isascii():
+            cleaned_text = cleaned_text.encode('ascii').translate(_LOWER_TAB).decode('ascii')
+        else:
+            cleaned_text = cleaned_text.lower()
+
+        # Add file info
+        file_info = {
+            "file_path": file_path,
+            "text": cleaned_text,
+            "total_pages": total_pages,
+            "pages_processed": len(chunks),
+            "text_length": len(cleaned_text),
+            "note": "Text was truncated to stay within token limits" if len(cleaned_text) >= max_total_chars else "Full content processed"
+        }
+
+        # Memoize in process, then persist so later runs skip extraction while
+        # the file fingerprint is unchanged; a failed cache write is not fatal
+        if memo_key is not None:
+            _PDF_CACHE[memo_key] = dict(file_info)
+        if cache_file is not None:
+            try:
+                os.makedirs(_PDF_CACHE_DIR, exist_ok=True)
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(file_info, f)
+            except OSError:
+                pass
+
+        print(f"Successfully processed: {file_path} ({len(cleaned_text)} characters)")
+
+        return file_info
+
+    except Exception as e:
+        print(f"Failed to process {file_path}: {str(e)}")
+        return {
+            "file_path": file_path,
+            "text": f"Error processing file: {str(e)}",
+            "error": str(e)
+        }
+
+
+def analyze_local_pdfs(max_pages: int = 10) -> dict:
+    """Analyzes all PDF files in the local docs/ folder.
+
+    Scans the docs/ directory for PDF files, extracts text content,
+    and preprocesses it by removing excessive whitespace and converting to lowercase.
+    Limits text extraction to prevent token limit issues.
+
+    Args:
+        max_pages (int): Maximum number of pages to extract per document
+
+    Returns:
+        dict: Status and documents data or error message.
+    """
+    docs_folder = _DEFAULT_DOCS_FOLDER
+
+    # Check if docs folder exists
+    if not os.path.exists(docs_folder):
+        return {
+            "status": "error",
+            "error_message": f"The '{docs_folder}' folder does not exist."
+        }
+
+    # Find all PDF files; scandir yields entries with cached file type and
+    # ready-made paths, avoiding per-entry stat calls and path joins
+    with os.scandir(docs_folder) as entries:
+        pdf_files = [
+            entry.path for entry in entries
+            if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith('.pdf')
+        ]
+
+    if not pdf_files:
+        print(f"No PDF files found in {docs_folder}/ folder.")
+        return {
+            "status": "error",
+            "error_message": f"No PDF files found in {docs_folder}/ folder."
+        }
+
+    print(f"Found {len(pdf_files)} PDF file(s) to analyze.")
+
+    # Extraction is CPU-bound per file and independent across files, so fan
+    # out over a process pool; results come back in input order. Workers are
+    # capped at 4 since per-file speedup flattens beyond that
+    if len(pdf_files) > 1:
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 4)) as executor:
+            documents = list(executor.map(partial(_process_pdf, max_pages=max_pages), pdf_files))
+    else:
+        documents = [_process_pdf(pdf_files[0], max_pages=max_pages)]
+
+    return {
+        "status": "success",
+        "documents": documents,
+        "note": "Large PDFs were truncated to prevent token limit issues. Consider using smaller files or breaking them into chunks."
+    }
+
+
+if __name__ == "__main__":
+    result = analyze_local_pdfs()
+    print(result)
@@ -2,18 +2,44 @@
 Research Scraper Mock Agent for simulating research database queries.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from google.adk.agents import LlmAgent
 from google.adk.models.lite_llm import LiteLlm
 from typing import Dict
 
 
+# Mock paper (source, title template) pairs, defined once at import
+_RESEARCH_TEMPLATES = (
+    ("arXiv", "Sample research paper about {domain} #1"),
+    ("SSRN", "Sample research paper about {domain} #2"),
+    ("arXiv", "Deep Learning Applications in {domain}: A Comprehensive Review"),
+    ("SSRN", "Market Dynamics and Innovation Patterns in the {domain} Industry"),
+    ("arXiv", "Machine Learning Methods for {domain} Optimization and Analysis"),
+    ("SSRN", "Economic Impact of {domain} Technologies on Global Markets"),
+    ("arXiv", "Algorithmic Approaches to {domain} Problem Solving"),
+    ("SSRN", "Investment Trends and Risk Assessment in {domain} Sector"),
+    ("arXiv", "Statistical Models for {domain} Data Processing and Prediction"),
+    ("SSRN", "Regulatory Framework and Policy Implications for {domain} Development")
+)
+
+
+@lru_cache(maxsize=128)
+def _search_research_cached(domain: str) -> tuple:
+    """Build immutable mock paper views for a domain, cached per domain."""
+    return tuple(
+        MappingProxyType({"source": source, "title": template.format(domain=domain)})
+        for source, template in _RESEARCH_TEMPLATES
+    )
+
+
 def search_research(domain: str) -> dict:
     """
     Mock function to simulate searching research databases like arXiv and SSRN for papers about a specific domain.
-    
+
     Args:
         domain (str): The domain keyword to search for
-        
+
     Returns:
         dict: Status and mocked research papers data or error message
     """
@@ -22,21 +48,14 @@ def search_research(domain: str) -> dict:
             "status": "error",
             "error_message": "Domain keyword required."
         }
-    
-    # Generate mock research papers based on the domain
-    mock_papers = [
-        {"source": "arXiv", "title": f"Sample research paper about {domain} #1"},
-        {"source": "SSRN", "title": f"Sample research paper about {domain} #2"},
-        {"source": "arXiv", "title": f"Deep Learning Applications in {domain}: A Comprehensive Review"},
-        {"source": "SSRN", "title": f"Market Dynamics and Innovation Patterns in the {domain} Industry"},
-        {"source": "arXiv", "title": f"Machine Learning Methods for {domain} Optimization and Analysis"},
-        {"source": "SSRN", "title": f"Economic Impact of {domain} Technologies on Global Markets"},
-        {"source": "arXiv", "title": f"Algorithmic Approaches to {domain} Problem Solving"},
-        {"source": "SSRN", "title": f"Investment Trends and Risk Assessment in {domain} Sector"},
-        {"source": "arXiv", "title": f"Statistical Models for {domain} Data Processing and Prediction"},
-        {"source": "SSRN", "title": f"Regulatory Framework and Policy Implications for {domain} Development"}
-    ]
-    
+
+    # Normalize the domain so whitespace variants share one cache entry
+    domain = domain.strip()
+
+    # Generate mock research papers based on the domain; repeated queries for
+    # the same domain copy the cached immutable views
+    mock_papers = [dict(paper) for paper in _search_research_cached(domain)]
+
     return {
         "status": "success",
         "papers": mock_papers
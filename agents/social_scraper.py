@@ -3,10 +3,24 @@ Social Media Scraper Agent for Reddit data collection.
 """
 
 import os
+import threading
+import time
 import praw
+from collections import OrderedDict
 from typing import List, Dict
 
 
+# Shared Reddit client so repeated agent instantiations reuse one HTTP session
+_REDDIT_CLIENT = None
+_REDDIT_LOCK = threading.Lock()
+
+# Short-lived bounded cache of search results so identical queries inside the
+# TTL window do not re-hit Reddit's rate limiter
+_SEARCH_CACHE: OrderedDict = OrderedDict()
+_SEARCH_CACHE_MAX = 128
+_SEARCH_CACHE_TTL_SECONDS = 60.0
+
+
 class SocialMediaScraperAgent:
     """Agent for scraping social media content from Reddit."""
     
@@ -19,18 +33,27 @@ class SocialMediaScraperAgent:
         # Initialize Reddit client
         self.reddit = None
         self._initialize_reddit_client()
+
+        # Resolve the r/all handle once so searches don't re-resolve it per call
+        self._subreddit_all = self.reddit.subreddit('all') if self.reddit else None
     
     def _initialize_reddit_client(self):
-        """Initialize the Reddit client with API credentials."""
-        try:
-            self.reddit = praw.Reddit(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                user_agent=self.user_agent
-            )
-        except Exception as e:
-            print(f"Warning: Failed to initialize Reddit client: {e}")
-            self.reddit = None
+        """Initialize the Reddit client, reusing the shared module-level instance."""
+        global _REDDIT_CLIENT
+        if _REDDIT_CLIENT is None:
+            # Double-checked locking so concurrent agent creations build the
+            # client (env lookup, credential parsing, session setup) only once
+            with _REDDIT_LOCK:
+                if _REDDIT_CLIENT is None:
+                    try:
+                        _REDDIT_CLIENT = praw.Reddit(
+                            client_id=self.client_id,
+                            client_secret=self.client_secret,
+                            user_agent=self.user_agent
+                        )
+                    except Exception as e:
+                        print(f"Warning: Failed to initialize Reddit client: {e}")
+        self.reddit = _REDDIT_CLIENT
     
     def run(self, domain: str) -> List[Dict[str, str]]:
         """
@@ -44,29 +67,35 @@ class SocialMediaScraperAgent:
         """
         if not self.reddit:
             return [{"source": "Reddit", "content": "Error: Reddit client not initialized. Please check your API credentials."}]
-        
+
+        # Serve repeated identical searches from the short-lived cache
+        cached = _SEARCH_CACHE.get(domain)
+        if cached is not None and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL_SECONDS:
+            _SEARCH_CACHE.move_to_end(domain)
+            return [dict(post) for post in cached[1]]
+
         try:
             # Search for posts in all subreddits
-            search_results = self.reddit.subreddit('all').search(
-                domain, 
+            search_results = self._subreddit_all.search(
+                domain,
                 sort='new',
                 time_filter='week',
                 limit=10
             )
-            
-            posts = []
-            for submission in search_results:
-                posts.append({
-                    "source": "Reddit",
-                    "content": submission.title
-                })
-            
-            # Handle case when no posts are found
-            if not posts:
-                return [{"source": "Reddit", "content": f"No posts found for domain {domain}"}]
-            
-            return posts
-            
+
+            posts = [{"source": "Reddit", "content": submission.title} for submission in search_results]
+
+            # Cache copies so callers mutating the returned posts cannot
+            # poison later hits, and evict the oldest entry past the cap
+            if posts:
+                _SEARCH_CACHE[domain] = (time.monotonic(), tuple(dict(post) for post in posts))
+                _SEARCH_CACHE.move_to_end(domain)
+                if len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX:
+                    _SEARCH_CACHE.popitem(last=False)
+
+            # Fall back to a sentinel entry when no posts are found
+            return posts or [{"source": "Reddit", "content": f"No posts found for domain {domain}"}]
+
         except praw.exceptions.RedditAPIException as e:
             return [{"source": "Reddit", "content": f"Reddit API Error: {str(e)}"}]
         except praw.exceptions.PRAWException as e:
@@ -2,11 +2,28 @@
 Summarization Agent for generating executive summaries from analysis results.
 """
 
+from collections import OrderedDict
 from typing import Dict
 from google.adk.agents import LlmAgent
 from google.adk.models.lite_llm import LiteLlm
 
 
+# Memoization of generated summaries; the function is pure, so identical
+# analysis results always produce the same summary text
+_SUMMARY_CACHE: OrderedDict = OrderedDict()
+_SUMMARY_CACHE_MAX = 128
+
+# Insight phrasing per topic, defined once in presentation order
+_TOPIC_INSIGHTS = (
+    ('Technology & Innovation', "significant technological advancement and innovation activity"),
+    ('Finance & Investment', "active financial markets and investment opportunities"),
+    ('Healthcare & Medical', "developments in healthcare and medical research"),
+    ('Business & Industry', "business growth and industrial development"),
+    ('Research & Analysis', "ongoing research initiatives and analytical studies"),
+    ('Market Trends', "emerging market trends and consumer behavior shifts")
+)
+
+
 def generate_summary(analysis_results: dict) -> dict:
     """
     Generate an executive-level plain-text summary from analysis results.
@@ -42,7 +59,19 @@ def generate_summary(analysis_results: dict) -> dict:
             "status": "error",
             "error_message": "No meaningful keywords or topics found in analysis results."
         }
-    
+
+    # Reuse a previously generated summary for identical analysis results
+    try:
+        cache_key = (tuple(keywords), tuple(topics), summary_notes)
+        cached = _SUMMARY_CACHE.get(cache_key)
+    except TypeError:
+        cache_key = None
+        cached = None
+    if cached is not None:
+        _SUMMARY_CACHE.move_to_end(cache_key)
+        return dict(cached)
+
+
     # Generate executive summary
     summary_parts = []
     
@@ -63,39 +92,29 @@ def generate_summary(analysis_results: dict) -> dict:
         else:
             summary_parts.append(f"Key findings highlight {', '.join(top_keywords)} as primary areas of focus.")
     
-    # Topic-specific insights
+    # Topic-specific insights selected from the table against a topic set,
+    # so each check is a hash probe instead of a list scan
     if topics:
-        topic_insights = []
-        
-        if 'Technology & Innovation' in topics:
-            topic_insights.append("significant technological advancement and innovation activity")
-        if 'Finance & Investment' in topics:
-            topic_insights.append("active financial markets and investment opportunities")
-        if 'Healthcare & Medical' in topics:
-            topic_insights.append("developments in healthcare and medical research")
-        if 'Business & Industry' in topics:
-            topic_insights.append("business growth and industrial development")
-        if 'Research & Analysis' in topics:
-            topic_insights.append("ongoing research initiatives and analytical studies")
-        if 'Market Trends' in topics:
-            topic_insights.append("emerging market trends and consumer behavior shifts")
-        
+        topic_set = frozenset(topics)
+        topic_insights = [insight for topic, insight in _TOPIC_INSIGHTS if topic in topic_set]
+
         if topic_insights:
             if len(topic_insights) == 1:
                 summary_parts.append(f"The analysis indicates {topic_insights[0]}.")
             else:
                 summary_parts.append(f"The analysis indicates {', '.join(topic_insights[:-1])}, and {topic_insights[-1]}.")
     
-    # Strategic implications
+    # Strategic implications, checked against the top keywords lowercased once
     strategic_implications = []
-    
-    if 'fintech' in [k.lower() for k in keywords[:5]] or 'Finance & Investment' in topics:
+    top5_lower = {k.lower() for k in keywords[:5]}
+
+    if 'fintech' in top5_lower or 'Finance & Investment' in topics:
         strategic_implications.append("opportunities in financial technology and digital payment solutions")
-    
-    if any(tech_word in [k.lower() for k in keywords[:5]] for tech_word in ['technology', 'tech', 'ai', 'digital']):
+
+    if top5_lower & {'technology', 'tech', 'ai', 'digital'}:
         strategic_implications.append("potential for technology-driven transformation and automation")
-    
-    if 'healthcare' in [k.lower() for k in keywords[:5]] or 'Healthcare & Medical' in topics:
+
+    if 'healthcare' in top5_lower or 'Healthcare & Medical' in topics:
         strategic_implications.append("growth prospects in healthcare innovation and medical technology")
     
     if strategic_implications:
@@ -113,12 +132,19 @@ def generate_summary(analysis_results: dict) -> dict:
     
     # Join all parts into final summary
     final_summary = " ".join(summary_parts)
-    
-    return {
+
+    result = {
         "status": "success",
         "summary": final_summary
     }
 
+    if cache_key is not None:
+        _SUMMARY_CACHE[cache_key] = dict(result)
+        if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_MAX:
+            _SUMMARY_CACHE.popitem(last=False)
+
+    return result
+
 
 # Define the Summarization agent
 summarization_agent = LlmAgent(
@@ -1,19 +1,240 @@
 """
-X.com (Twitter) Mock Scraper Agent for simulating social media data collection.
+X.com (Twitter) Scraper Agents for social media data collection.
+
+Contains the real API-backed ``XComScraperAgent`` and the mock
+``search_x_com`` tool used by the ADK agent.
 """
 
+import itertools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+import urllib3
 from google.adk.agents import LlmAgent
 from google.adk.models.lite_llm import LiteLlm
-from typing import Dict
+from typing import Dict, List
+
+
+# Error messages for non-200 responses, keyed by HTTP status
+_STATUS_ERRORS = {
+    401: "Error: Unauthorized. Please check your bearer token.",
+    429: "Error: Rate limit exceeded. Please try again later."
+}
+
+# Error message templates keyed by exception type, checked in order;
+# urllib3's TimeoutError subclasses HTTPError, so it must come first
+_ERROR_MESSAGES = (
+    (urllib3.exceptions.TimeoutError, "Error: Request to X.com timed out."),
+    (urllib3.exceptions.HTTPError, "Error: Could not connect to X.com."),
+    (ValueError, "Error: Invalid JSON response - {error}")
+)
+
+
+class XComScraperAgent:
+    """Agent for scraping recent posts from X.com (Twitter) via the v2 search API."""
+
+    def __init__(self):
+        """Initialize the X.com API client with environment variables."""
+        # Accept a comma-separated token list so the effective quota scales
+        # with the number of tokens; fall back to the single-token variable
+        tokens = [t.strip() for t in os.getenv('TWITTER_BEARER_TOKENS', '').split(',') if t.strip()]
+        if not tokens:
+            tokens = [os.getenv('TWITTER_BEARER_TOKEN', 'your_bearer_token_here')]
+        self.tokens = tokens
+        self.bearer_token = tokens[0]
+        self.base_url = "https://api.twitter.com/2/tweets/search/recent"
+        self.headers = {
+            "User-Agent": "MarketTrendAnalyzer/1.0"
+        }
+
+        # One connection pool per token, picked round-robin per request so
+        # rate-limit quota is spread evenly across tokens
+        self._pools = [self._build_pool(token) for token in tokens]
+        self._pool_cycle = itertools.cycle(self._pools)
+        self.pool = self._pools[0]
+
+        # Per-pool rate-limit state learned from X.com's response headers,
+        # guarded by one lock so run_many's worker threads share a view; each
+        # entry is [remaining, reset_ts] for its token's pool
+        self._rate_lock = threading.Lock()
+        self._quota = {id(pool): [None, 0.0] for pool in self._pools}
+
+    def _build_pool(self, token: str) -> urllib3.PoolManager:
+        """Build a pooled urllib3 client with retries for a single bearer token.
+
+        A persistent pool keeps connections alive so repeated queries reuse
+        one TCP/TLS connection, without the per-request cookie, hook, and
+        environment-merging machinery a full requests.Session layers on top.
+        """
+        headers = dict(self.headers)
+        headers["Authorization"] = f"Bearer {token}"
+        # raise_on_status=False so an exhausted retry budget returns the last
+        # response instead of MaxRetryError; 429s must reach the status
+        # dispatch and the quota tracker rather than surface as a connection
+        # error
+        retry = urllib3.Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        return urllib3.PoolManager(
+            num_pools=2,
+            maxsize=20,
+            headers=headers,
+            retries=retry,
+            timeout=urllib3.Timeout(connect=5, read=30)
+        )
+
+    def _acquire_pool(self):
+        """Pick the next pool whose token still has quota in its window.
+
+        Exhausted tokens are skipped so the round-robin only visits tokens
+        that can serve a request; only when every token is exhausted does
+        this sleep, and then just until the soonest window reset.
+        """
+        while True:
+            now = time.time()
+            soonest_reset = None
+            with self._rate_lock:
+                for _ in range(len(self._pools)):
+                    pool = next(self._pool_cycle)
+                    remaining, reset_ts = self._quota[id(pool)]
+                    if remaining is None or remaining > 1:
+                        return pool
+                    if reset_ts <= now:
+                        # The window rolled over; forget the stale count
+                        self._quota[id(pool)][0] = None
+                        return pool
+                    if soonest_reset is None or reset_ts < soonest_reset:
+                        soonest_reset = reset_ts
+            delay = soonest_reset - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+    def _update_quota(self, pool, response):
+        """Record the rate-limit headers from the latest response for one pool."""
+        remaining = response.headers.get('x-rate-limit-remaining')
+        reset_ts = response.headers.get('x-rate-limit-reset')
+        if remaining is None or reset_ts is None:
+            return
+        try:
+            with self._rate_lock:
+                self._quota[id(pool)] = [int(remaining), float(reset_ts)]
+        except ValueError:
+            pass
+
+    def run(self, domain: str) -> List[Dict[str, str]]:
+        """
+        Search X.com for recent posts containing the domain keyword.
+
+        Args:
+            domain (str): The domain keyword to search for
+
+        Returns:
+            List[Dict[str, str]]: List of dictionaries with 'source' and 'content' keys
+        """
+        params = {
+            "query": domain,
+            "max_results": 10
+        }
+
+        try:
+            # Route around exhausted tokens instead of burning a request on a
+            # 429; this only blocks when every token's window is spent
+            pool = self._acquire_pool()
+            response = pool.request('GET', self.base_url, fields=params)
+            self._update_quota(pool, response)
+
+            if response.status != 200:
+                message = _STATUS_ERRORS.get(
+                    response.status,
+                    f"Error: X.com API returned status {response.status}"
+                )
+                return [{"source": "X.com", "content": message}]
+
+            # Parse the raw bytes directly; no charset detection pass needed
+            data = json.loads(response.data)
+            tweets = data.get("data", [])
+            posts = [{"source": "X.com", "content": tweet.get("text", "")} for tweet in tweets]
+
+            # Handle case when no posts are found
+            return posts or [{"source": "X.com", "content": f"No posts found for domain {domain}"}]
+
+        except Exception as e:
+            message = next(
+                (template.format(error=e) for exc_type, template in _ERROR_MESSAGES if isinstance(e, exc_type)),
+                f"Unexpected error: {str(e)}"
+            )
+            return [{"source": "X.com", "content": message}]
+
+    def run_many(self, domains: List[str]) -> List[List[Dict[str, str]]]:
+        """
+        Search X.com for several domains concurrently.
+
+        The requests share the connection pools, so total latency approaches
+        the slowest single query instead of the sum of all of them.
+
+        Args:
+            domains (List[str]): The domain keywords to search for
+
+        Returns:
+            List[List[Dict[str, str]]]: One post list per domain, in input order
+        """
+        if not domains:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(len(domains), 10)) as executor:
+            return list(executor.map(self.run, domains))
+
+    def close(self):
+        """Release the pooled connections."""
+        for pool in self._pools:
+            pool.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Mock post templates, defined once at import
+_X_COM_TEMPLATES = (
+    "Latest trending post about {domain} #1",
+    "Latest trending post about {domain} #2",
+    "Breaking news in {domain} industry today! #innovation",
+    "New developments in {domain} are changing the game",
+    "Just discovered an amazing {domain} startup 🚀",
+    "Thread: Why {domain} is the future of technology (1/5)",
+    "Market analysis shows {domain} growing 200% this year",
+    "Investors are bullish on {domain} companies #investing",
+    "Conference highlights: The state of {domain} in 2025",
+    "Hot take: {domain} will dominate the next decade #prediction"
+)
+
+
+@lru_cache(maxsize=128)
+def _search_x_com_cached(domain: str) -> tuple:
+    """Build immutable mock post views for a domain, cached per domain."""
+    return tuple(
+        MappingProxyType({"source": "X.com", "content": template.format(domain=domain)})
+        for template in _X_COM_TEMPLATES
+    )
 
 
 def search_x_com(domain: str) -> dict:
     """
     Mock function to simulate searching X.com (Twitter) for posts about a specific domain.
-    
+
     Args:
         domain (str): The domain keyword to search for
-        
+
     Returns:
         dict: Status and mocked posts data or error message
     """
@@ -22,21 +243,14 @@ def search_x_com(domain: str) -> dict:
             "status": "error",
             "error_message": "Domain keyword required."
         }
-    
-    # Generate mock posts based on the domain
-    mock_posts = [
-        {"source": "X.com", "content": f"Latest trending post about {domain} #1"},
-        {"source": "X.com", "content": f"Latest trending post about {domain} #2"},
-        {"source": "X.com", "content": f"Breaking news in {domain} industry today! #innovation"},
-        {"source": "X.com", "content": f"New developments in {domain} are changing the game"},
-        {"source": "X.com", "content": f"Just discovered an amazing {domain} startup 🚀"},
-        {"source": "X.com", "content": f"Thread: Why {domain} is the future of technology (1/5)"},
-        {"source": "X.com", "content": f"Market analysis shows {domain} growing 200% this year"},
-        {"source": "X.com", "content": f"Investors are bullish on {domain} companies #investing"},
-        {"source": "X.com", "content": f"Conference highlights: The state of {domain} in 2025"},
-        {"source": "X.com", "content": f"Hot take: {domain} will dominate the next decade #prediction"}
-    ]
-    
+
+    # Normalize the domain so whitespace variants share one cache entry
+    domain = domain.strip()
+
+    # Generate mock posts based on the domain; repeated queries for the same
+    # domain copy the cached immutable views
+    mock_posts = [dict(post) for post in _search_x_com_cached(domain)]
+
     return {
         "status": "success",
         "posts": mock_posts
@@ -1,15 +1,14 @@
 import datetime
 import os
-import re
 from zoneinfo import ZoneInfo
 from google.adk.agents import Agent
 from google.adk.agents import LlmAgent
 from google.adk.models.lite_llm import LiteLlm
-import fitz  # PyMuPDF
 
 # Import the new agents using absolute imports
 try:
     from agents.analysis import analyze_collected_results
+    from agents.pdf_analysis import analyze_local_pdfs
     from agents.summarization import generate_summary
 except ImportError:
     # Fallback: try relative import from parent directory
@@ -22,6 +21,7 @@ except ImportError:
         sys.path.insert(0, project_root)
     try:
         from agents.analysis import analyze_collected_results
+        from agents.pdf_analysis import analyze_local_pdfs
         from agents.summarization import generate_summary
     except ImportError:
         # If still can't import, define the functions locally
@@ -39,117 +39,106 @@ except ImportError:
                 "error_message": "Summary function not available - agents module not found."
             }
 
+        def analyze_local_pdfs(max_pages: int = 10) -> dict:
+            """Fallback PDF analysis function when agents module is not available."""
+            return {
+                "status": "error",
+                "error_message": "PDF analysis function not available - agents module not found."
+            }
 
-def analyze_local_pdfs() -> dict:
-    """Analyzes all PDF files in the local docs/ folder.
-    
-    Scans the docs/ directory for PDF files, extracts text content,
-    and preprocesses it by removing excessive whitespace and converting to lowercase.
-    Limits text extraction to prevent token limit issues.
-    
-    Returns:
-        dict: Status and documents data or error message.
+
+# Mock content templates for the search tools, defined once at import
+_NEWS_TEMPLATES = (
+    "Sample headline about {domain} #1",
+    "Sample headline about {domain} #2",
+    "Breaking: Major {domain} company announces breakthrough innovation",
+    "Industry experts predict significant growth in {domain} sector",
+    "New regulations could impact {domain} market dynamics",
+    "Global {domain} market reaches record high this quarter",
+    "Startup disrupts traditional {domain} industry with AI technology",
+    "Investment surge in {domain} companies signals market confidence",
+    "Research reveals consumer trends shifting toward {domain} solutions",
+    "International summit addresses future of {domain} innovation"
+)
+
+_X_COM_TEMPLATES = (
+    "Latest trending post about {domain} #1",
+    "Latest trending post about {domain} #2",
+    "Breaking news in {domain} industry today! #innovation",
+    "New developments in {domain} are changing the game",
+    "Just discovered an amazing {domain} startup 🚀",
+    "Thread: Why {domain} is the future of technology (1/5)",
+    "Market analysis shows {domain} growing 200% this year",
+    "Investors are bullish on {domain} companies #investing",
+    "Conference highlights: The state of {domain} in 2025",
+    "Hot take: {domain} will dominate the next decade #prediction"
+)
+
+_RESEARCH_TEMPLATES = (
+    ("arXiv", "Sample research paper about {domain} #1"),
+    ("SSRN", "Sample research paper about {domain} #2"),
+    ("arXiv", "Deep Learning Applications in {domain}: A Comprehensive Review"),
+    ("SSRN", "Market Dynamics and Innovation Patterns in the {domain} Industry"),
+    ("arXiv", "Machine Learning Methods for {domain} Optimization and Analysis"),
+    ("SSRN", "Economic Impact of {domain} Technologies on Global Markets"),
+    ("arXiv", "Algorithmic Approaches to {domain} Problem Solving"),
+    ("SSRN", "Investment Trends and Risk Assessment in {domain} Sector"),
+    ("arXiv", "Statistical Models for {domain} Data Processing and Prediction"),
+    ("SSRN", "Regulatory Framework and Policy Implications for {domain} Development")
+)
+
+def iter_news_articles(domain: str):
     """
-    # Get the directory where this agent file is located
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    docs_folder = os.path.join(current_dir, "docs")
-    
-    # Check if docs folder exists
-    if not os.path.exists(docs_folder):
-        return {
-            "status": "error",
-            "error_message": f"The '{docs_folder}' folder does not exist."
-        }
-    
-    # Find all PDF files
-    pdf_files = []
-    for filename in os.listdir(docs_folder):
-        if filename.lower().endswith('.pdf'):
-            pdf_files.append(os.path.join(docs_folder, filename))
-    
-    if not pdf_files:
-        print(f"No PDF files found in {docs_folder}/ folder.")
-        return {
-            "status": "error",
-            "error_message": f"No PDF files found in {docs_folder}/ folder."
-        }
-    
-    print(f"Found {len(pdf_files)} PDF file(s) to analyze.")
-    
-    documents = []
-    
-    for file_path in pdf_files:
-        try:
-            print(f"Processing: {file_path}")
-            
-            # Extract text using PyMuPDF with size limits
-            doc = fitz.open(file_path)
-            text_content = ""
-            max_pages = 10  # Limit to first 10 pages
-            max_chars_per_page = 5000  # Limit characters per page
-            total_pages = doc.page_count
-            
-            for page_num in range(min(total_pages, max_pages)):
-                page = doc[page_num]
-                page_text = page.get_text()
-                
-                # Limit characters per page
-                if len(page_text) > max_chars_per_page:
-                    page_text = page_text[:max_chars_per_page] + "... [truncated]"
-                
-                text_content += page_text + "\n"
-            
-            # Preprocess text
-            # Remove excessive whitespace and newlines
-            cleaned_text = re.sub(r'\s+', ' ', text_content.strip())
-            
-            # Limit total text size to prevent token limit issues
-            max_total_chars = 15000  # Conservative limit
-            if len(cleaned_text) > max_total_chars:
-                cleaned_text = cleaned_text[:max_total_chars] + "... [content truncated due to size]"
-            
-            # Convert to lowercase
-            cleaned_text = cleaned_text.lower()
-            
-            # Add file info
-            file_info = {
-                "file_path": file_path,
-                "text": cleaned_text,
-                "total_pages": total_pages,
-                "pages_processed": min(total_pages, max_pages),
-                "text_length": len(cleaned_text),
-                "note": "Text was truncated to stay within token limits" if len(cleaned_text) >= max_total_chars else "Full content processed"
-            }
-            
-            # Close the document after we've extracted all needed information
-            doc.close()
-            
-            documents.append(file_info)
-            
-            print(f"Successfully processed: {file_path} ({len(cleaned_text)} characters)")
-            
-        except Exception as e:
-            print(f"Failed to process {file_path}: {str(e)}")
-            documents.append({
-                "file_path": file_path,
-                "text": f"Error processing file: {str(e)}",
-                "error": str(e)
-            })
-    
-    return {
-        "status": "success",
-        "documents": documents,
-        "note": "Large PDFs were truncated to prevent token limit issues. Consider using smaller files or breaking them into chunks."
-    }
+    Yield mock news articles about a specific domain one at a time.
+
+    Callers that only need counts or a head slice can consume this lazily
+    without materializing the full result list.
+
+    Args:
+        domain (str): The domain keyword to search for
+
+    Yields:
+        dict: Article with 'source' and 'content' keys
+    """
+    for template in _NEWS_TEMPLATES:
+        yield {"source": "NewsAPI", "content": template.format(domain=domain)}
+
+
+def iter_x_com_posts(domain: str):
+    """
+    Yield mock X.com posts about a specific domain one at a time.
+
+    Args:
+        domain (str): The domain keyword to search for
+
+    Yields:
+        dict: Post with 'source' and 'content' keys
+    """
+    for template in _X_COM_TEMPLATES:
+        yield {"source": "X.com", "content": template.format(domain=domain)}
+
+
+def iter_research_papers(domain: str):
+    """
+    Yield mock research papers about a specific domain one at a time.
+
+    Args:
+        domain (str): The domain keyword to search for
+
+    Yields:
+        dict: Paper with 'source' and 'title' keys
+    """
+    for source, template in _RESEARCH_TEMPLATES:
+        yield {"source": source, "title": template.format(domain=domain)}
 
 
 def search_news_articles(domain: str) -> dict:
     """
     Search for news articles about a specific domain using the news scraper agent.
-    
+
     Args:
         domain (str): The domain keyword to search for
-        
+
     Returns:
         dict: Status and news articles data or error message
     """
@@ -158,21 +147,10 @@ def search_news_articles(domain: str) -> dict:
             "status": "error",
             "error_message": "Domain keyword required."
         }
-    
+
     # Generate mock news articles based on the domain
-    mock_articles = [
-        {"source": "NewsAPI", "content": f"Sample headline about {domain} #1"},
-        {"source": "NewsAPI", "content": f"Sample headline about {domain} #2"},
-        {"source": "NewsAPI", "content": f"Breaking: Major {domain} company announces breakthrough innovation"},
-        {"source": "NewsAPI", "content": f"Industry experts predict significant growth in {domain} sector"},
-        {"source": "NewsAPI", "content": f"New regulations could impact {domain} market dynamics"},
-        {"source": "NewsAPI", "content": f"Global {domain} market reaches record high this quarter"},
-        {"source": "NewsAPI", "content": f"Startup disrupts traditional {domain} industry with AI technology"},
-        {"source": "NewsAPI", "content": f"Investment surge in {domain} companies signals market confidence"},
-        {"source": "NewsAPI", "content": f"Research reveals consumer trends shifting toward {domain} solutions"},
-        {"source": "NewsAPI", "content": f"International summit addresses future of {domain} innovation"}
-    ]
-    
+    mock_articles = list(iter_news_articles(domain))
+
     return {
         "status": "success",
         "articles": mock_articles
@@ -196,19 +174,8 @@ def search_x_com_posts(domain: str) -> dict:
         }
     
     # Generate mock posts based on the domain
-    mock_posts = [
-        {"source": "X.com", "content": f"Latest trending post about {domain} #1"},
-        {"source": "X.com", "content": f"Latest trending post about {domain} #2"},
-        {"source": "X.com", "content": f"Breaking news in {domain} industry today! #innovation"},
-        {"source": "X.com", "content": f"New developments in {domain} are changing the game"},
-        {"source": "X.com", "content": f"Just discovered an amazing {domain} startup 🚀"},
-        {"source": "X.com", "content": f"Thread: Why {domain} is the future of technology (1/5)"},
-        {"source": "X.com", "content": f"Market analysis shows {domain} growing 200% this year"},
-        {"source": "X.com", "content": f"Investors are bullish on {domain} companies #investing"},
-        {"source": "X.com", "content": f"Conference highlights: The state of {domain} in 2025"},
-        {"source": "X.com", "content": f"Hot take: {domain} will dominate the next decade #prediction"}
-    ]
-    
+    mock_posts = list(iter_x_com_posts(domain))
+
     return {
         "status": "success",
         "posts": mock_posts
@@ -317,19 +284,8 @@ def search_research_papers(domain: str) -> dict:
         }
     
     # Generate mock research papers based on the domain
-    mock_papers = [
-        {"source": "arXiv", "title": f"Sample research paper about {domain} #1"},
-        {"source": "SSRN", "title": f"Sample research paper about {domain} #2"},
-        {"source": "arXiv", "title": f"Deep Learning Applications in {domain}: A Comprehensive Review"},
-        {"source": "SSRN", "title": f"Market Dynamics and Innovation Patterns in the {domain} Industry"},
-        {"source": "arXiv", "title": f"Machine Learning Methods for {domain} Optimization and Analysis"},
-        {"source": "SSRN", "title": f"Economic Impact of {domain} Technologies on Global Markets"},
-        {"source": "arXiv", "title": f"Algorithmic Approaches to {domain} Problem Solving"},
-        {"source": "SSRN", "title": f"Investment Trends and Risk Assessment in {domain} Sector"},
-        {"source": "arXiv", "title": f"Statistical Models for {domain} Data Processing and Prediction"},
-        {"source": "SSRN", "title": f"Regulatory Framework and Policy Implications for {domain} Development"}
-    ]
-    
+    mock_papers = list(iter_research_papers(domain))
+
     return {
         "status": "success",
         "papers": mock_papers
@@ -0,0 +1,13 @@
+"""
+Pytest bootstrap: resolve the app directory onto sys.path once per session.
+
+Direct script runs go through _deps.py, which performs the same guarded
+insert, so the path is computed a single time either way.
+"""
+
+import os
+import sys
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app')
+if APP not in sys.path:
+    sys.path.insert(0, APP)
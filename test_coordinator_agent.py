@@ -3,57 +3,60 @@
 Test script for the Market Trend Coordinator Agent functionality.
 """
 
-import sys
-import os
-
-# Add the app directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
-
-try:
-    from multi_tool_agent.agent import (
-        root_agent, 
-        search_news_articles, 
-        search_x_com_posts, 
-        get_comprehensive_analysis
-    )
-    DEPENDENCIES_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️  Missing dependency: {e}")
-    print("Please install dependencies with: pip install -r requirements.txt")
-    DEPENDENCIES_AVAILABLE = False
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared probe handles sys.path setup and imports once per process
+from _deps import (
+    DEPENDENCIES_AVAILABLE,
+    root_agent,
+    search_news_articles,
+    search_x_com_posts,
+    get_comprehensive_analysis
+)
+
+def _ok(result):
+    """Return True when a tool result exists and reports success."""
+    return bool(result) and result.get('status') == 'success'
 
 def test_news_search():
-    """Test the news search functionality."""
+    """Test the news search functionality.
+
+    Returns the result and its diagnostic block; output is buffered so
+    concurrent test runs do not interleave their lines.
+    """
     if not DEPENDENCIES_AVAILABLE:
-        print("❌ Cannot test - dependencies not installed")
-        return None
-    
-    print("Testing news search functionality...")
+        return None, "❌ Cannot test - dependencies not installed"
+
+    lines = ["Testing news search functionality..."]
     result = search_news_articles("Fintech")
-    print(f"News search result: {result}")
-    return result
+    lines.append(f"News search result: {result}")
+    return result, "\n".join(lines)
 
 def test_x_com_search():
-    """Test the X.com search functionality."""
+    """Test the X.com search functionality.
+
+    Returns the result and its diagnostic block, buffered as above.
+    """
     if not DEPENDENCIES_AVAILABLE:
-        print("❌ Cannot test - dependencies not installed")
-        return None
-    
-    print("Testing X.com search functionality...")
+        return None, "❌ Cannot test - dependencies not installed"
+
+    lines = ["Testing X.com search functionality..."]
     result = search_x_com_posts("Healthcare")
-    print(f"X.com search result: {result}")
-    return result
+    lines.append(f"X.com search result: {result}")
+    return result, "\n".join(lines)
 
 def test_comprehensive_analysis():
-    """Test the comprehensive analysis functionality."""
+    """Test the comprehensive analysis functionality.
+
+    Returns the result and its diagnostic block, buffered as above.
+    """
     if not DEPENDENCIES_AVAILABLE:
-        print("❌ Cannot test - dependencies not installed")
-        return None
-    
-    print("Testing comprehensive analysis functionality...")
+        return None, "❌ Cannot test - dependencies not installed"
+
+    lines = ["Testing comprehensive analysis functionality..."]
     result = get_comprehensive_analysis("AI")
-    print(f"Comprehensive analysis result: {result}")
-    return result
+    lines.append(f"Comprehensive analysis result: {result}")
+    return result, "\n".join(lines)
 
 def test_coordinator_agent():
     """Test the coordinator agent tools directly."""
@@ -63,14 +66,20 @@ def test_coordinator_agent():
         
     print("\nTesting coordinator agent tools...")
     try:
+        # Snapshot agent attributes into locals once; ADK exposes these as
+        # validated properties, so repeated access is not free
+        tools = getattr(root_agent, 'tools', ())
+        tool_names = [tool.__name__ for tool in tools]
+        name = root_agent.name
+        description = root_agent.description
+
         # Test that the agent has the expected tools
-        tools = root_agent.tools if hasattr(root_agent, 'tools') else []
-        print(f"Agent has {len(tools)} tools: {[tool.__name__ for tool in tools]}")
-        
+        print(f"Agent has {len(tools)} tools: {tool_names}")
+
         # Test that the agent has the expected name and description
-        print(f"Agent name: {root_agent.name}")
-        print(f"Agent description: {root_agent.description}")
-        
+        print(f"Agent name: {name}")
+        print(f"Agent description: {description}")
+
         return True
     except Exception as e:
         print(f"Error testing coordinator agent: {e}")
@@ -80,20 +89,34 @@ if __name__ == "__main__":
     print("🧪 Testing Market Trend Coordinator Agent implementation...")
     
     if DEPENDENCIES_AVAILABLE:
-        # Test individual functions
-        news_result = test_news_search()
-        x_com_result = test_x_com_search()
-        comprehensive_result = test_comprehensive_analysis()
+        # The three function tests are independent, so run them concurrently;
+        # wall time collapses to the slowest test instead of the sum. Each
+        # test buffers its own diagnostics, printed in order afterwards so
+        # the concurrent runs cannot interleave output
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            news_future = executor.submit(test_news_search)
+            x_com_future = executor.submit(test_x_com_search)
+            comprehensive_future = executor.submit(test_comprehensive_analysis)
+            news_result, news_output = news_future.result()
+            x_com_result, x_com_output = x_com_future.result()
+            comprehensive_result, comprehensive_output = comprehensive_future.result()
+        print("\n".join([news_output, x_com_output, comprehensive_output]))
         
         # Test the coordinator agent
         agent_result = test_coordinator_agent()
         
-        print("\n✅ Testing completed!")
-        print("\nSummary:")
-        print(f"- News search: {'✅' if news_result and news_result.get('status') == 'success' else '❌'}")
-        print(f"- X.com search: {'✅' if x_com_result and x_com_result.get('status') == 'success' else '❌'}")
-        print(f"- Comprehensive analysis: {'✅' if comprehensive_result and comprehensive_result.get('status') == 'success' else '❌'}")
-        print(f"- Coordinator agent tools: {'✅' if agent_result else '❌'}")
+        # Collect the summary into one buffered write instead of a print
+        # (and flush) per line
+        results = {
+            'News search': news_result,
+            'X.com search': x_com_result,
+            'Comprehensive analysis': comprehensive_result
+        }
+        lines = ["\n✅ Testing completed!", "\nSummary:"]
+        for name, result in results.items():
+            lines.append(f"- {name}: {'✅' if _ok(result) else '❌'}")
+        lines.append(f"- Coordinator agent tools: {'✅' if agent_result else '❌'}")
+        print("\n".join(lines))
     else:
-        print("\n📋 Implementation is ready but requires dependencies.")
-        print("Run 'pip install -r requirements.txt' to install dependencies and test the functionality.") 
\ No newline at end of file
+        print("\n📋 Implementation is ready but requires dependencies.\n"
+              "Run 'pip install -r requirements.txt' to install dependencies and test the functionality.")
\ No newline at end of file